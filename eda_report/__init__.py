@@ -17,6 +17,7 @@ def get_word_report(
     groupby_variable: Union[str, int] = None,
     output_filename: str = "eda-report.docx",
     table_style: str = "Table Grid",
+    cache: bool = False,
 ) -> ReportDocument:
     """Analyze `data`, and generate a report document in *Word* (*.docx*)
     format.
@@ -33,6 +34,10 @@ def get_word_report(
             document. Defaults to "eda-report.docx".
         table_style (str, optional): The style to apply to the tables created.
             Defaults to "Table Grid".
+        cache (bool, optional): Whether to reuse (and keep) the results and
+            graphs of recently analyzed variables, e.g. when re-running a
+            report on the same data. Cached results are held in memory for
+            the life of the process. Defaults to False.
 
     Returns:
         ReportDocument: Document object with analysis results.
@@ -48,6 +53,7 @@ def get_word_report(
         output_filename=output_filename,
         groupby_variable=groupby_variable,
         table_style=table_style,
+        cache=cache,
     )
 
 
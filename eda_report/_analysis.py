@@ -1,4 +1,5 @@
-from multiprocessing import Pool
+from functools import cached_property
+from multiprocessing import Pool, cpu_count
 from typing import Dict, Iterable, Optional, Union
 
 import pandas as pd
@@ -6,8 +7,50 @@ from tqdm import tqdm
 
 from eda_report._validate import _validate_groupby_variable
 from eda_report.bivariate import Dataset
-from eda_report.plotting import _plot_dataset, _plot_variable
-from eda_report.univariate import Variable, _analyze_univariate
+from eda_report.plotting import (
+    _cache_graph,
+    _get_cached_graph,
+    _get_graph_kinds,
+    _plot_dataset,
+    _plot_graph,
+)
+from eda_report.univariate import (
+    Variable,
+    _analyze_univariate,
+    _cache_variable,
+    _get_cache_key,
+    _get_cached_variable,
+)
+
+
+def _get_contingency_table(
+    data: pd.Series, groupby_data: pd.Series
+) -> pd.DataFrame:
+    """Get a contingency table, with row and column totals, for a categorical
+    variable.
+
+    This counts value pairs with a single ``groupby``, which is much faster
+    than :func:`pandas.crosstab` (whose margins need extra pivot tables).
+
+    Args:
+        data (pandas.Series): Categorical data.
+        groupby_data (pandas.Series): Values to group by.
+
+    Returns:
+        pandas.DataFrame: Counts of values in each group.
+    """
+    # Only count observed pairs of values, as crosstab does
+    table = (
+        groupby_data.groupby([data, groupby_data], observed=True)
+        .size()
+        .unstack(fill_value=0)
+    )
+    if table.empty:
+        # No rows have values for both variables
+        return table
+    table["Total"] = table.sum(axis=1)
+    table.loc["Total"] = table.sum(axis=0)
+    return table
 
 
 def _get_contingency_tables(
@@ -25,20 +68,15 @@ def _get_contingency_tables(
     if (categorical_df.shape[1] == 0) or (groupby_data is None):
         return {}
 
-    contingency_tables = {
-        col: pd.crosstab(
-            index=categorical_df[col],
-            columns=groupby_data,
-            margins=True,
-            margins_name="Total",
-        )
-        for col in categorical_df
-        # Only include columns with upto 20 unique values to cut clutter
-        if categorical_df[col].nunique() <= 20
+    # Only include columns with upto 20 unique values to cut clutter. Count
+    # unique values for all the columns in one call.
+    num_unique = categorical_df.nunique()
+    return {
+        col: _get_contingency_table(categorical_df[col], groupby_data)
+        for col in num_unique.index[num_unique <= 20]
+        # Exclude groupby_variable in case it is among the categorical cols
+        if col != groupby_data.name
     }
-    # Exclude groupby_variable in case it is among the categorical cols
-    contingency_tables.pop(groupby_data.name, None)
-    return contingency_tables
 
 
 class _AnalysisResult:
@@ -50,6 +88,9 @@ class _AnalysisResult:
             Defaults to "cyan".
         groupby_variable (Union[str, int], optional): The column to
             use to group values. Defaults to None.
+        cache (bool, optional): Whether to reuse (and keep) the results and
+            graphs of recently analyzed variables. Cached results are held in
+            memory for the life of the process. Defaults to False.
     """
 
     def __init__(
@@ -57,8 +98,10 @@ class _AnalysisResult:
         data: Iterable,
         graph_color: str = "cyan",
         groupby_variable: Union[str, int] = None,
+        cache: bool = False,
     ) -> None:
         self.GRAPH_COLOR = graph_color
+        self._use_cache = cache
         self.dataset = Dataset(data)
         self.GROUPBY_DATA = _validate_groupby_variable(
             data=self.dataset.data, groupby_variable=groupby_variable
@@ -66,8 +109,6 @@ class _AnalysisResult:
         self.variables = self._analyze_variables()
         self.univariate_stats = self._get_univariate_statistics()
         self.normality_tests = self._get_normality_test_results()
-        self.univariate_graphs = self._get_univariate_graphs()
-        self.bivariate_graphs = _plot_dataset(self.dataset, color=graph_color)
         self.bivariate_summaries = self._get_bivariate_summaries()
 
     def _analyze_variables(self) -> Dict[str, Variable]:
@@ -77,21 +118,46 @@ class _AnalysisResult:
             Dict[str, Variable]: Univariate analysis results.
         """
         data = self.dataset.data
-        with Pool() as p:
-            univariate_stats = dict(
-                tqdm(
+        if self._use_cache:
+            # Hashing every column is only worthwhile if results are reused
+            self._cache_keys = cache_keys = {
+                name: _get_cache_key(col) for name, col in data.items()
+            }
+            univariate_stats = {
+                name: _get_cached_variable(key)
+                for name, key in cache_keys.items()
+            }
+        else:
+            univariate_stats = dict.fromkeys(data.columns)
+        # Only analyze variables that haven't been analyzed recently
+        uncached = [
+            name for name, var in univariate_stats.items() if var is None
+        ]
+        if uncached:
+            # Don't start more processes than there are columns to analyze,
+            # and send columns to workers in batches for wide datasets.
+            processes = min(cpu_count(), len(uncached))
+            chunksize = max(1, len(uncached) // (4 * processes))
+            with Pool(processes) as p:
+                for name, variable in tqdm(
                     # Analyze variables concurrently
-                    p.imap(_analyze_univariate, data.items()),
+                    p.imap(
+                        _analyze_univariate,
+                        data[uncached].items(),
+                        chunksize=chunksize,
+                    ),
                     # Progress-bar options
-                    total=data.shape[1],
+                    total=len(uncached),
                     bar_format=(
                         "{desc} {percentage:3.0f}%|{bar:35}| "
                         "{n_fmt}/{total_fmt}"
                     ),
                     desc="Analyze variables: ",
                     dynamic_ncols=True,
-                )
-            )
+                ):
+                    univariate_stats[name] = variable
+                    if self._use_cache:
+                        _cache_variable(cache_keys[name], variable)
         # Create contingency tables
         categorical_cols = [
             col_name
@@ -126,38 +192,106 @@ class _AnalysisResult:
             if variable.var_type == "numeric"
         }
 
+    @cached_property
+    def univariate_graphs(self) -> Dict[str, Dict]:
+        """Dict[str, Dict]: Univariate graphs. These are only plotted when
+        first accessed, so that summary statistics can be obtained without
+        incurring the cost of rendering graphs.
+        """
+        return self._get_univariate_graphs()
+
     def _get_univariate_graphs(self) -> Dict[str, Dict]:
         """Plot graphs for all variables present.
 
         Returns:
             Dict[str, Dict]: Univariate graphs.
         """
-        with Pool() as p:
-            data = self.dataset.data
-            variable_data_hue_and_color = [
-                (
-                    variable,
-                    data[variable.name],
-                    self.GROUPBY_DATA,
-                    self.GRAPH_COLOR,
-                )
-                for variable in self.variables.values()
-            ]
-            univariate_graphs = dict(
-                tqdm(
-                    # Plot variables in parallel processes
-                    p.imap(_plot_variable, variable_data_hue_and_color),
-                    # Progress-bar options
-                    total=len(self.variables),
-                    bar_format=(
-                        "{desc} {percentage:3.0f}%|{bar:35}| "
-                        "{n_fmt}/{total_fmt}"
-                    ),
-                    desc="Plot variables:    ",
-                    dynamic_ncols=True,
-                )
+        data = self.dataset.data
+        if self._use_cache and self.GROUPBY_DATA is not None:
+            hue_key = _get_cache_key(self.GROUPBY_DATA)
+        else:
+            hue_key = None
+        graphs, graph_keys = {}, {}
+        # Plot each graph as a separate task, so that the (up to 3) graphs
+        # for a numeric variable are also rendered in parallel. Only plot
+        # graphs that haven't been plotted recently.
+        name_kind_data_hue_and_color = []
+        for name, variable in self.variables.items():
+            for kind in _get_graph_kinds(variable):
+                if self._use_cache:
+                    key = graph_keys[name, kind] = (
+                        self._cache_keys[name],
+                        kind,
+                        str(self.GRAPH_COLOR),
+                        hue_key,
+                    )
+                    graph = _get_cached_graph(key)
+                else:
+                    graph = None
+                if graph is None:
+                    name_kind_data_hue_and_color.append(
+                        (
+                            name,
+                            kind,
+                            data[name],
+                            self.GROUPBY_DATA,
+                            self.GRAPH_COLOR,
+                        )
+                    )
+                else:
+                    graphs[name, kind] = graph
+
+        if name_kind_data_hue_and_color:
+            self._plot_univariate_graphs(
+                name_kind_data_hue_and_color, graphs, graph_keys
             )
-        return univariate_graphs
+        # Arrange each variable's graphs in the usual order, whether or not
+        # they were cached.
+        return {
+            name: {
+                kind: graphs[name, kind] for kind in _get_graph_kinds(variable)
+            }
+            for name, variable in self.variables.items()
+        }
+
+    def _plot_univariate_graphs(
+        self,
+        name_kind_data_hue_and_color: list,
+        graphs: Dict,
+        graph_keys: Dict,
+    ) -> None:
+        """Plot graphs in parallel processes.
+
+        Args:
+            name_kind_data_hue_and_color (list): Arguments for each graph.
+            graphs (Dict): Graphs, by variable name and kind of graph.
+            graph_keys (Dict): Cache keys for the graphs.
+        """
+        processes = min(cpu_count(), len(name_kind_data_hue_and_color))
+        with Pool(processes) as p:
+            for name, kind, graph in tqdm(
+                # Plot graphs in parallel processes
+                p.imap(_plot_graph, name_kind_data_hue_and_color),
+                # Progress-bar options
+                total=len(name_kind_data_hue_and_color),
+                bar_format=(
+                    "{desc} {percentage:3.0f}%|{bar:35}| "
+                    "{n_fmt}/{total_fmt} graphs."
+                ),
+                desc="Plot variables:    ",
+                dynamic_ncols=True,
+            ):
+                graphs[name, kind] = graph
+                if self._use_cache:
+                    _cache_graph(graph_keys[name, kind], graph)
+
+    @cached_property
+    def bivariate_graphs(self) -> Optional[Dict]:
+        """Optional[Dict]: The correlation plot and regression plots, if there
+        are at least 2 numeric variables. Like the univariate graphs, these
+        are only plotted when first accessed.
+        """
+        return _plot_dataset(self.dataset, color=self.GRAPH_COLOR)
 
     def _get_bivariate_summaries(self) -> Optional[Dict[str, str]]:
         """Get descriptions of the nature of correlation between numeric
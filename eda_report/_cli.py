@@ -1,14 +1,20 @@
 import argparse
-from typing import Optional
+from typing import Optional, Sequence
 
 from eda_report._read_file import df_from_file
 from eda_report.document import ReportDocument
 
 
-def process_cli_args() -> argparse.Namespace:
+def process_cli_args(
+    argv: Optional[Sequence[str]] = None,
+) -> argparse.Namespace:
     """Captures and parses input from the command line interface using the
     :mod:`argparse` module from the Python standard library.
 
+    Args:
+        argv (Sequence[str], optional): The arguments to parse. Defaults to
+            None, which parses ``sys.argv[1:]``.
+
     Returns:
         argparse.Namespace: Object with the parsed arguments as attributes.
 
@@ -59,18 +65,24 @@ def process_cli_args() -> argparse.Namespace:
             " column label."
         ),
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def run_from_cli() -> Optional[ReportDocument]:
+def run_from_cli(
+    argv: Optional[Sequence[str]] = None,
+) -> Optional[ReportDocument]:
     """Creates an exploratory data analysis report in *Word* format using input
     from the command line interface.
 
     This is the function executed when the package is run as a script (using
     ``python -m eda_report``). It is also the entry point for the
     ``eda-report`` command (console script).
+
+    Args:
+        argv (Sequence[str], optional): Command line arguments. Defaults to
+            None, which uses ``sys.argv[1:]``.
     """
-    args = process_cli_args()
+    args = process_cli_args(argv)
     if args.infile is None:
         from eda_report.gui import EDAGUI
         # Launch graphical user interface to select and analyze a file
@@ -14,6 +14,10 @@ class _ReportContent(_AnalysisResult):
             Defaults to "cyan".
         groupby_variable (Union[str, int], optional): The column to
             use to group values. Defaults to None.
+        cache (bool, optional): Whether to reuse (and keep) the results and
+            graphs of recently analyzed variables, e.g. when re-running a
+            report on the same data. Cached results are held in memory for
+            the life of the process. Defaults to False.
     """
 
     def __init__(
@@ -23,9 +27,13 @@ class _ReportContent(_AnalysisResult):
         title: str = "Exploratory Data Analysis Report",
         graph_color: str = "cyan",
         groupby_variable: Union[str, int] = None,
+        cache: bool = False,
     ) -> None:
         super().__init__(
-            data, graph_color=graph_color, groupby_variable=groupby_variable
+            data,
+            graph_color=graph_color,
+            groupby_variable=groupby_variable,
+            cache=cache,
         )
         self.TITLE = title
         self.intro_text = self._get_introductory_summary()
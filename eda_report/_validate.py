@@ -2,8 +2,9 @@ import logging
 from collections.abc import Iterable
 from typing import Optional, Union
 
-from pandas import DataFrame, RangeIndex, Series
-from pandas.api.types import is_numeric_dtype
+import numpy as np
+from pandas import CategoricalDtype, DataFrame, Index, RangeIndex, Series
+from pandas.api.types import is_numeric_dtype, is_object_dtype
 
 from eda_report.exceptions import (
     EmptyDataError,
@@ -11,6 +12,9 @@ from eda_report.exceptions import (
     InputError,
 )
 
+# Labels for data with default column labels (a RangeIndex), built just once
+_DEFAULT_LABELS = tuple(f"var_{i}" for i in range(1, 1025))
+
 
 def _clean_column_labels(data: DataFrame) -> DataFrame:
     """Makes sure that columns have *meaningful* names.
@@ -32,15 +36,51 @@ def _clean_column_labels(data: DataFrame) -> DataFrame:
         pandas.DataFrame: The ``data``, with human-friendly column
         names.
     """
-    if isinstance(data.columns, RangeIndex):
-        data.columns = [f"var_{i+1}" for i in data.columns]
+    # Build the labels with vectorized string operations, rather than
+    # formatting them one column at a time.
+    if data.columns.inferred_type == "string":
+        # The labels are already strings, e.g. if the data was cleaned
+        # before. `inferred_type` is cached by the (immutable) Index.
+        return data
+    elif isinstance(data.columns, RangeIndex):
+        num_columns = len(data.columns)
+        if data.columns.equals(RangeIndex(num_columns)) and (
+            num_columns <= len(_DEFAULT_LABELS)
+        ):
+            # Reuse prebuilt labels for the usual 0, 1, 2, ... columns
+            data.columns = Index(_DEFAULT_LABELS[:num_columns])
+        else:
+            data.columns = "var_" + (data.columns + 1).astype(str)
     elif is_numeric_dtype(data.columns):
-        data.columns = [f"var_{i}" for i in data.columns]
+        data.columns = "var_" + data.columns.astype(str)
+    elif is_object_dtype(data.columns):
+        data.columns = data.columns.astype(str)
     else:
+        # e.g. MultiIndex or DatetimeIndex columns, whose `astype(str)`
+        # either isn't supported or differs from `str`.
         data.columns = data.columns.map(str)
     return data
 
 
+def _summarize_labels(labels: Index, *, max_labels: int = 20) -> str:
+    """Get a description of column labels for messages, listing no more than
+    ``max_labels`` of them.
+
+    Args:
+        labels (pandas.Index): Column labels.
+        max_labels (int, optional): The maximum number of labels to list.
+            Defaults to 20.
+
+    Returns:
+        str: The labels, as a list.
+    """
+    listed, num_labels = labels[:max_labels].to_list(), len(labels)
+    if num_labels > max_labels:
+        return f"{listed} (and {num_labels - max_labels} more)"
+    else:
+        return f"{listed}"
+
+
 def _check_cardinality(groupby_data: Series, *, threshold: int = 10) -> None:
     """Assesses whether the ``groupby_data`` has too many unique values
     (> ``threshold``, default 10).
@@ -54,10 +94,19 @@ def _check_cardinality(groupby_data: Series, *, threshold: int = 10) -> None:
         GroupbyVariableError: If the `groupby_data` has cardinality outside the
             acceptable range.
     """
-    if groupby_data.nunique() > threshold:
+    if len(groupby_data) <= threshold:
+        # There can't be more unique values than there are values
+        return None
+    elif isinstance(groupby_data.dtype, CategoricalDtype) and (
+        len(groupby_data.cat.categories) <= threshold
+    ):
+        # Observed values are a subset of the categories, so there is no need
+        # to count them.
+        return None
+    elif (num_unique := groupby_data.nunique()) > threshold:
         message = (
             f"Group-by variable '{groupby_data.name}' not used to group "
-            f"values. It has high cardinality ({groupby_data.nunique()}) "
+            f"values. It has high cardinality ({num_unique}) "
             f"and would clutter graphs."
         )
         logging.warning(message)
@@ -82,22 +131,33 @@ def _validate_dataset(data: Iterable) -> DataFrame:
     Returns:
         pandas.DataFrame: The input data as a DataFrame.
     """
-    try:
-        data_frame = DataFrame(data)
-    except Exception:
-        raise InputError(
-            f"Expected a pandas.Dataframe object, but got {type(data)}."
-        )
-    # The data should not be empty
-    if len(data_frame) == 0:
+    if isinstance(data, DataFrame):
+        data_frame = data
+    else:
+        try:
+            data_frame = DataFrame(data)
+        except Exception:
+            raise InputError(
+                f"Expected a pandas.Dataframe object, but got {type(data)}."
+            )
+    # The data should not be empty. Frames without columns are let through,
+    # since data whose columns were all empty (and dropped) can be validated
+    # again, e.g. by `summarize`.
+    if data_frame.shape[0] == 0:
         raise EmptyDataError("No data to process.")
 
-    data_frame = (
-        # Attempt to infer better dtypes for columns.
-        data_frame.infer_objects()
-        # Drop completely empty columns.
-        .dropna(axis=1, how="all")
-    )
+    # Attempt to infer better dtypes for columns. Only object columns can
+    # change, so skip the inference pass if there are none.
+    if (data_frame.dtypes == object).any():
+        data_frame = data_frame.infer_objects()
+
+    # Drop completely empty columns.
+    empty_columns = data_frame.isna().all()
+    if empty_columns.any():
+        data_frame = data_frame.loc[:, ~empty_columns]
+    else:
+        # Avoid copying the values, but don't relabel the input's columns
+        data_frame = data_frame.copy(deep=False)
     return _clean_column_labels(data_frame)
 
 
@@ -123,6 +183,11 @@ def _validate_univariate_input(
     """
     if data is None:
         return None
+    elif isinstance(data, Series):
+        # Reuse the existing values rather than re-wrapping them
+        series = data if name is None else data.rename(name, copy=False)
+    elif isinstance(data, np.ndarray) and data.ndim == 1:
+        series = Series(data, name=name, copy=False)
     else:
         try:
             series = Series(data, name=name)
@@ -130,14 +195,14 @@ def _validate_univariate_input(
             raise InputError(
                 f"Expected a one-dimensional sequence, but got {type(data)}."
             )
+    # Check for emptiness before converting any values
+    if series.empty:
+        raise EmptyDataError("No data to process.")
+
     # Convert potentially mixed-type items to strings
     if series.dtype == "O":
         series = series.astype("string")
-
-    if series.shape[0] == 0:
-        raise EmptyDataError("No data to process.")
-    else:
-        return series
+    return series
 
 
 def _validate_groupby_variable(
@@ -159,24 +224,32 @@ def _validate_groupby_variable(
     """
     if groupby_variable is None:
         return None
-    elif f"{groupby_variable}".isdecimal():
-        idx = int(groupby_variable)
-        try:
-            groupby_data = data.iloc[:, idx]
-        except IndexError:
+    elif (
+        # Check integers directly, rather than formatting them as strings
+        isinstance(groupby_variable, (int, np.integer))
+        and not isinstance(groupby_variable, bool)
+        and groupby_variable >= 0
+    ) or (
+        # Indices from the command line or GUI arrive as strings
+        isinstance(groupby_variable, str)
+        and groupby_variable.isdecimal()
+    ):
+        idx, num_columns = int(groupby_variable), data.shape[1]
+        if idx >= num_columns:
             raise GroupbyVariableError(
                 f"Column index {groupby_variable} is not in the range"
-                f" [0, {data.columns.size}]."
+                f" [0, {num_columns}]."
             )
+        groupby_data = data.iloc[:, idx]
         _check_cardinality(groupby_data)
         return groupby_data
     elif isinstance(groupby_variable, str):
-        try:
-            groupby_data = data[groupby_variable]
-        except KeyError:
+        if groupby_variable not in data.columns:
             raise GroupbyVariableError(
-                f"{groupby_variable!r} is not in {data.columns.to_list()}"
+                f"{groupby_variable!r} is not in "
+                f"{_summarize_labels(data.columns)}"
             )
+        groupby_data = data[groupby_variable]
         _check_cardinality(groupby_data)
         return groupby_data
     else:
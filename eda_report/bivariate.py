@@ -1,9 +1,10 @@
 import logging
 from collections.abc import Iterable
-from itertools import combinations
+from functools import cached_property
 from textwrap import indent
-from typing import List
+from typing import List, Optional, Tuple
 
+import numpy as np
 from pandas import DataFrame
 
 from eda_report._validate import _validate_dataset
@@ -26,12 +27,26 @@ def _compute_correlation(dataframe: DataFrame) -> List:
     if numeric_data.shape[1] < 2:
         return None
     else:
-        correlation_df = numeric_data.corr(method="pearson")
-        unique_pairs = list(combinations(correlation_df.columns, r=2))
-        correlation_info = [
-            (pair, correlation_df.at[pair]) for pair in unique_pairs
+        data = numeric_data.to_numpy(dtype=np.float64, na_value=np.nan)
+        if len(data) < 2 or np.isnan(data).any():
+            # Let pandas correlate each pair over the rows where both have
+            # values
+            correlation = numeric_data.corr(method="pearson").to_numpy()
+        else:
+            # Without missing values, NumPy computes the same coefficients
+            # far faster, with a single matrix product.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                correlation = np.corrcoef(data.T)
+        # Take the unique pairs from the upper triangle of the matrix, rather
+        # than looking up each pair's value separately.
+        columns = numeric_data.columns.to_list()
+        rows, cols = np.triu_indices(len(columns), k=1)
+        values = correlation[rows, cols]
+        # A stable sort keeps tied pairs in their original order
+        order = np.argsort(-np.abs(values), kind="stable")
+        return [
+            ((columns[rows[k]], columns[cols[k]]), values[k]) for k in order
         ]
-        return sorted(correlation_info, key=lambda x: -abs(x[1]))
 
 
 def _describe_correlation(corr_value: float) -> str:
@@ -80,7 +95,6 @@ class Dataset:
 
     def __init__(self, data: Iterable) -> None:
         self.data = _validate_dataset(data)
-        self._get_summary_statistics()
         self._get_bivariate_analysis()
 
     def __repr__(self) -> str:
@@ -147,17 +161,55 @@ class Dataset:
             ]
         )
 
-    def _get_summary_statistics(self) -> None:
-        """Compute descriptive statistics."""
-        data = self.data.copy()
-        numeric_data = data.select_dtypes("number")
-        # Consider numeric columns with < 11 unique values as categorical
-        categorical_with_numbers = [
-            col for col in numeric_data if numeric_data[col].nunique() < 11
-        ]
-        numeric_data = numeric_data.drop(columns=categorical_with_numbers)
+    @cached_property
+    def _numeric_data(self) -> DataFrame:
+        """pandas.DataFrame: The numeric features. Selecting them copies the
+        data, so this is only done once.
+        """
+        return self.data.select_dtypes("number")
+
+    @cached_property
+    def _summary_statistics(
+        self,
+    ) -> Tuple[Optional[DataFrame], Optional[DataFrame]]:
+        """Tuple[Optional[pandas.DataFrame], Optional[pandas.DataFrame]]:
+        Summary statistics for numeric and categorical features. These are
+        only computed when first accessed, e.g. so that plotting correlation
+        doesn't incur the cost.
+        """
+        return self._get_summary_statistics()
+
+    @property
+    def _numeric_stats(self) -> Optional[DataFrame]:
+        """Optional[pandas.DataFrame]: Summary statistics for numeric
+        features.
+        """
+        return self._summary_statistics[0]
+
+    @property
+    def _categorical_stats(self) -> Optional[DataFrame]:
+        """Optional[pandas.DataFrame]: Summary statistics for categorical
+        features.
+        """
+        return self._summary_statistics[1]
+
+    def _get_summary_statistics(
+        self,
+    ) -> Tuple[Optional[DataFrame], Optional[DataFrame]]:
+        """Compute descriptive statistics for both numeric and categorical
+        features, since the features are told apart in the same pass.
+
+        Returns:
+            Tuple[Optional[pandas.DataFrame], Optional[pandas.DataFrame]]:
+            Numeric and categorical summary statistics.
+        """
+        data = self.data
+        numeric_data = self._numeric_data
+        # Consider numeric columns with < 11 unique values as categorical.
+        # Count unique values for all the columns in one call.
+        numeric_data = numeric_data.loc[:, numeric_data.nunique() >= 11]
         if numeric_data.shape[1] < 1:
-            self._numeric_stats = None
+            numeric_stats = None
         else:
             numeric_stats = numeric_data.describe().T
             numeric_stats["count"] = numeric_stats["count"].astype("int")
@@ -166,34 +218,31 @@ class Dataset:
             )
             numeric_stats["skewness"] = numeric_data.skew(numeric_only=True)
             numeric_stats["kurtosis"] = numeric_data.kurt(numeric_only=True)
-            self._numeric_stats = numeric_stats.round(4)
+            numeric_stats = numeric_stats.round(4)
 
-        categorical_data = data.drop(columns=numeric_data.columns).copy()
+        categorical_data = data.drop(columns=numeric_data.columns)
         if categorical_data.shape[1] < 1:
-            self._categorical_stats = None
+            categorical_stats = None
         else:
-            for col in categorical_data:
-                # Convert categorical columns with "unique ratio" < 0.3 to
-                # categorical dtype, which would consume much less memory.
-                if (
-                    categorical_data[col].nunique() / len(categorical_data)
-                ) < 0.3:
-                    categorical_data[col] = categorical_data[col].astype(
-                        "category"
-                    )
-                else:
-                    categorical_data[col] = categorical_data[col].astype(
-                        "string"
-                    )
+            unique_ratios = categorical_data.nunique() / len(categorical_data)
+            # Convert categorical columns with "unique ratio" < 0.3 to
+            # categorical dtype, which would consume much less memory. Convert
+            # all the columns in one call, rather than assigning each one.
+            categorical_data = categorical_data.astype(
+                {
+                    col: "category" if ratio < 0.3 else "string"
+                    for col, ratio in unique_ratios.items()
+                }
+            )
             categorical_stats = categorical_data.describe().T
             categorical_stats["relative freq"] = (
                 categorical_stats["freq"] / len(self.data)
-            ).apply(lambda x: f"{x :.2%}")
-            self._categorical_stats = categorical_stats
+            ).map("{:.2%}".format)
+        return numeric_stats, categorical_stats
 
     def _get_bivariate_analysis(self) -> None:
         """Compare numeric column pairs."""
-        self._correlation_values = _compute_correlation(self.data)
+        self._correlation_values = _compute_correlation(self._numeric_data)
         if self._correlation_values is None:
             logging.warning(
                 "Skipped Bivariate Analysis: There are less than 2 numeric "
@@ -40,6 +40,10 @@ class ReportDocument(_ReportContent):
             to. Defaults to "eda-report.docx".
         table_style (str, optional): The style to apply to the tables created.
             Defaults to "Table Grid".
+        cache (bool, optional): Whether to reuse (and keep) the results and
+            graphs of recently analyzed variables, e.g. when re-running a
+            report on the same data. Cached results are held in memory for
+            the life of the process. Defaults to False.
     """
 
     def __init__(
@@ -51,12 +55,14 @@ class ReportDocument(_ReportContent):
         groupby_variable: Union[str, int] = None,
         output_filename: str = "eda-report.docx",
         table_style: str = "Table Grid",
+        cache: bool = False,
     ) -> None:
         super().__init__(
             data,
             title=title,
             graph_color=graph_color,
             groupby_variable=groupby_variable,
+            cache=cache,
         )
         self.OUTPUT_FILENAME = output_filename
         self.TABLE_STYLE = table_style
@@ -1,20 +1,31 @@
+import threading
+from collections import OrderedDict
 from io import BytesIO
-from multiprocessing import Pool
+from multiprocessing import Pool, cpu_count
 from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
 
 import matplotlib as mpl
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.colors import to_rgb
 from matplotlib.figure import Figure
-from scipy.stats import gaussian_kde, probplot
+from pandas import Series
+from PIL import Image
+from scipy.signal import fftconvolve
+from scipy.special import ndtri
+from scipy.stats import gaussian_kde
 from tqdm import tqdm
 
 from eda_report._validate import _validate_dataset, _validate_univariate_input
 from eda_report.bivariate import Dataset
+from eda_report.univariate import Variable
 
 # Matplotlib configuration
 GENERAL_RC_PARAMS = {
+    # Render long paths in chunks, simplifying away indiscernible vertices
+    "agg.path.chunksize": 10_000,
+    "path.simplify": True,
     "axes.spines.top": False,
     "axes.spines.right": False,
     "axes.titlesize": 12,
@@ -49,8 +60,30 @@ def _savefig(figure: Figure) -> BytesIO:
     Returns:
         io.BytesIO: A graph in PNG format as bytes.
     """
+    canvas = figure.canvas
+    if not isinstance(canvas, FigureCanvasAgg):
+        canvas = FigureCanvasAgg(figure)
+    original_dpi = figure.dpi
+    # Rasterize at the resolution `savefig` would have used, then encode the
+    # RGBA buffer directly. A low zlib compression level encodes much faster
+    # than the default (6), for only slightly larger images.
+    figure.dpi = mpl.rcParams["savefig.dpi"]
+    try:
+        canvas.draw()
+        image = Image.frombuffer(
+            "RGBA",
+            canvas.get_width_height(),
+            canvas.buffer_rgba(),
+            "raw",
+            "RGBA",
+            0,
+            1,
+        )
+    finally:
+        figure.dpi = original_dpi
     graph = BytesIO()
-    figure.savefig(graph, format="png")
+    image.save(graph, format="PNG", compress_level=1)
+    graph.seek(0)
     return graph
 
 
@@ -74,6 +107,43 @@ def _get_or_validate_axes(ax: Axes = None) -> Axes:
         raise TypeError(f"Invalid input for 'ax': {type(ax)}")
 
 
+# Axes reused for internally plotted graphs, one per kind of graph (and
+# thread), to avoid setting up a new figure for every graph.
+_AXES_POOL = threading.local()
+_POOLED_RC_PARAMS = {
+    "box_plot": BOXPLOT_RC_PARAMS,
+    "kde_plot": GENERAL_RC_PARAMS,
+    "prob_plot": REGPLOT_RC_PARAMS,
+    "bar_plot": GENERAL_RC_PARAMS,
+}
+# Recently plotted univariate graphs (as PNG bytes), keyed by the variable's
+# cache key, the kind of graph, the color and the hue's cache key.
+_GRAPH_CACHE = OrderedDict()
+_MAX_CACHED_GRAPHS = 256
+
+
+def _get_pooled_axes(kind: str) -> Axes:
+    """Get a cleared, reusable Axes instance for a kind of graph.
+
+    Args:
+        kind (str): The kind of graph, e.g. "box_plot".
+
+    Returns:
+        Axes: Axes instance.
+    """
+    if not hasattr(_AXES_POOL, "axes"):
+        _AXES_POOL.axes = {}
+
+    # Figure dimensions and axes styles are read from the rcParams
+    with mpl.rc_context(_POOLED_RC_PARAMS[kind]):
+        if kind in _AXES_POOL.axes:
+            ax = _AXES_POOL.axes[kind]
+            ax.clear()
+        else:
+            ax = _AXES_POOL.axes[kind] = Figure().subplots()
+    return ax
+
+
 def _get_color_shades_of(color: str, num: int = None) -> Sequence:
     """Obtain an array with `num` shades of the specified `color`.
 
@@ -142,6 +212,94 @@ def box_plot(
     return ax
 
 
+def _fit_kde(data: Series, *, max_size: int = 10_000) -> gaussian_kde:
+    """Fit a gaussian kernel density estimator to numeric values.
+
+    Large samples are thinned to ``max_size`` evenly spaced order statistics,
+    since evaluating the estimate scales with the number of points. The
+    bandwidth is still computed from the full sample (Scott's rule), so the
+    curve keeps the same smoothness.
+
+    Args:
+        data (pandas.Series): Non-null numeric values.
+        max_size (int, optional): The maximum number of points to fit.
+            Defaults to 10_000.
+
+    Returns:
+        scipy.stats.gaussian_kde: The fitted estimator.
+    """
+    values = data.to_numpy(dtype=float)
+    num = len(values)
+    if num <= max_size:
+        return gaussian_kde(values)
+    sample = np.sort(values)[np.linspace(0, num - 1, num=max_size, dtype=int)]
+    # Scale the bandwidth factor so that the kernel's width matches the full
+    # sample's, since extreme values are over-represented in the thinned one.
+    factor = num ** (-1 / 5) * values.std(ddof=1) / sample.std(ddof=1)
+    return gaussian_kde(sample, bw_method=factor)
+
+
+def _get_kde_density(
+    data: Series,
+    eval_points: np.ndarray,
+    *,
+    max_size: int = 10_000,
+    max_grid_size: int = 2**14,
+) -> np.ndarray:
+    """Estimate the probability density of numeric values at
+    ``eval_points``, with a gaussian kernel and Scott's rule bandwidth.
+
+    Samples with more than ``max_size`` values are linearly binned onto a
+    regular grid (10 points per bandwidth), and the kernel is applied
+    with an FFT convolution, in O(n + g log g) time rather than O(n·g). The
+    density is then interpolated at the ``eval_points``. If the grid would
+    need more than ``max_grid_size`` points, e.g. due to far-off outliers,
+    this falls back to :func:`_fit_kde`.
+
+    Args:
+        data (pandas.Series): Non-null numeric values.
+        eval_points (numpy.ndarray): Ascending points to evaluate the density
+            at.
+        max_size (int, optional): The sample size above which values are
+            binned. Defaults to 10_000.
+        max_grid_size (int, optional): The maximum number of grid points.
+            Defaults to 2**14.
+
+    Returns:
+        numpy.ndarray: The estimated density at each of the ``eval_points``.
+    """
+    values = data.to_numpy(dtype=float)
+    num = len(values)
+    bandwidth = values.std(ddof=1) * num ** (-1 / 5)
+    if num > max_size and bandwidth > 0:
+        # Extend the grid by 4 bandwidths, so that kernel mass near the edges
+        # is accounted for.
+        low = min(values.min(), eval_points[0]) - 4 * bandwidth
+        high = max(values.max(), eval_points[-1]) + 4 * bandwidth
+        grid_size = int(np.ceil(10 * (high - low) / bandwidth)) + 1
+        if grid_size <= max_grid_size:
+            grid, step = np.linspace(low, high, num=grid_size, retstep=True)
+            # Split each value's weight between its 2 nearest grid points
+            position = (values - low) / step
+            lower_idx = np.minimum(position.astype(int), grid_size - 2)
+            upper_weight = position - lower_idx
+            counts = np.bincount(
+                lower_idx, weights=1 - upper_weight, minlength=grid_size
+            ) + np.bincount(
+                lower_idx + 1, weights=upper_weight, minlength=grid_size
+            )
+            # An odd number of offsets, centred on 0, so that the convolution
+            # doesn't shift the density.
+            half_width = int(np.ceil(4 * bandwidth / step))
+            offsets = np.arange(-half_width, half_width + 1) * step
+            kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+            kernel /= num * bandwidth * np.sqrt(2 * np.pi)
+            density = fftconvolve(counts, kernel, mode="same")
+            # Clip tiny negative values caused by floating point error
+            return np.interp(eval_points, grid, np.maximum(density, 0))
+    return _fit_kde(data, max_size=max_size)(eval_points)
+
+
 @mpl.rc_context(GENERAL_RC_PARAMS)
 def kde_plot(
     data: Iterable,
@@ -172,10 +330,11 @@ def kde_plot(
         ax.text(x=0.08, y=0.45, s=msg, color="#f72", size=14, weight=600)
         return ax
 
-    eval_points = np.linspace(data.min(), data.max(), num=len(data))
+    # Evaluate the density on a fixed-size grid. Using one point per
+    # observation made evaluation quadratic in the size of the data.
+    eval_points = np.linspace(data.min(), data.max(), num=200)
     if hue is None:
-        kernel = gaussian_kde(data)
-        density = kernel(eval_points)
+        density = _get_kde_density(data, eval_points)
         ax.plot(eval_points, density, label=label, color=color)
         ax.fill_between(eval_points, density, alpha=0.3, color=color)
     else:
@@ -186,8 +345,7 @@ def kde_plot(
             colors = _get_color_shades_of(color, hue.nunique())
 
         for color, (key, series) in zip(colors, data.groupby(hue)):
-            kernel = gaussian_kde(series)
-            density = kernel(eval_points)
+            density = _get_kde_density(series, eval_points)
             ax.plot(eval_points, density, label=key, alpha=0.75, color=color)
             ax.fill_between(eval_points, density, alpha=0.25, color=color)
 
@@ -224,12 +382,25 @@ def prob_plot(
         matplotlib.axes.Axes: Matplotlib axes with the probability-plot.
     """
     original_data = _validate_univariate_input(data)
-    data = original_data.dropna()
+    # Sort once, and derive the theoretical quantiles directly rather than
+    # having `scipy.stats.probplot` re-sort the data.
+    ordered = np.sort(original_data.dropna().to_numpy())
     ax = _get_or_validate_axes(ax)
-    probplot(data, fit=True, plot=ax)
-    ax.lines[0].set_color(marker_color)
-    ax.lines[1].set_color(line_color)
+    num = len(ordered)
+    # Blom's plotting positions approximate the normal order statistic medians
+    theoretical = ndtri((np.arange(1, num + 1) - 0.375) / (num + 0.25))
+    # Plot at most 5000 evenly spaced points (including both extremes). The
+    # line of best fit still uses all the data.
+    shown = np.linspace(0, num - 1, num=min(num, 5000)).astype(int)
+    ax.plot(theoretical[shown], ordered[shown], "o", color=marker_color)
+    if num >= 2:
+        # A line can only be fitted through at least 2 points. It only needs
+        # its end-points.
+        slope, intercept = np.polyfit(theoretical, ordered, deg=1)
+        ends = theoretical[[0, -1]]
+        ax.plot(ends, slope * ends + intercept, color=line_color)
     ax.set_xlabel("Theoretical Quantiles (Normal)")
+    ax.set_ylabel("Ordered Values")
     ax.set_title(f"Probability plot of {label}")
     return ax
 
@@ -257,10 +428,12 @@ def bar_plot(
     data = original_data.dropna()
     ax = _get_or_validate_axes(ax)
     # Include no more than 10 of the most common values
-    top_10 = data.value_counts().nlargest(10)
+    value_counts = data.value_counts(sort=False)
+    top_10 = value_counts.nlargest(10)
     bars = ax.bar(top_10.index.map(str), top_10, alpha=0.8, color=color)
-    ax.bar_label(bars, labels=[f"{x:,.0f}" for x in top_10], padding=2)
-    if (num_unique := data.nunique()) > 10:
+    ax.bar_label(bars, fmt="{:,.0f}", padding=2)
+    # Exclude any unobserved categories in categorical data
+    if (num_unique := (value_counts > 0).sum()) > 10:
         title = f"Bar-plot of {label} (Top 10 of {num_unique})"
     else:
         title = f"Bar-plot of {label}"
@@ -270,9 +443,49 @@ def bar_plot(
     return ax
 
 
+def _get_graph_kinds(variable: Variable) -> Tuple[str, ...]:
+    """Get the kinds of graphs to plot for a variable, based on its type.
+
+    Args:
+        variable (Variable): Univariate analysis results.
+
+    Returns:
+        Tuple[str, ...]: The names of the graphs to plot.
+    """
+    if variable.var_type == "numeric":
+        return ("box_plot", "kde_plot", "prob_plot")
+    else:  # {"boolean", "categorical", "datetime", "numeric (<=10 levels)"}
+        return ("bar_plot",)
+
+
+def _plot_graph(name_kind_data_hue_and_color: Tuple) -> Tuple:
+    """Helper function to concurrently plot individual graphs in a
+    multiprocessing Pool.
+
+    Args:
+        name_kind_data_hue_and_color (Tuple): A variable's name, the kind of
+            graph, plot data, hue data and the desired plot color.
+
+    Returns:
+        Tuple: The variable's name, the kind of graph, and the graph in PNG
+        format.
+    """
+    name, kind, data, hue, color = name_kind_data_hue_and_color
+    # The graph is saved right away, so its figure can be reused
+    ax = _get_pooled_axes(kind)
+    if kind == "box_plot":
+        box_plot(data=data, hue=hue, label=name, color=color, ax=ax)
+    elif kind == "kde_plot":
+        kde_plot(data=data, hue=hue, label=name, color=color, ax=ax)
+    elif kind == "prob_plot":
+        prob_plot(data, label=name, marker_color=color, ax=ax)
+    else:
+        bar_plot(data, label=name, color=color, ax=ax)
+    return name, kind, _savefig(ax.figure)
+
+
 def _plot_variable(variable_data_hue_and_color: Tuple) -> Tuple:
-    """Helper function to concurrently plot variables in a multiprocessing
-    Pool.
+    """Helper function to plot all the graphs for a variable.
 
     Args:
         variable_data_hue_and_color (Tuple): A variable, plot data, hue data
@@ -282,22 +495,10 @@ def _plot_variable(variable_data_hue_and_color: Tuple) -> Tuple:
         Tuple: `variable`s name, and graphs in a dict.
     """
     variable, data, hue, color = variable_data_hue_and_color
-    if variable.var_type == "numeric":
-        plots = {
-            "box_plot": box_plot(
-                data=data, hue=hue, label=variable.name, color=color
-            ),
-            "kde_plot": kde_plot(
-                data=data, hue=hue, label=variable.name, color=color
-            ),
-            "prob_plot": prob_plot(
-                data, label=variable.name, marker_color=color
-            ),
-        }
-    else:  # {"boolean", "categorical", "datetime", "numeric (<=10 levels)"}
-        plots = {"bar_plot": bar_plot(data, label=variable.name, color=color)}
-
-    graph_images = {name: _savefig(ax.figure) for name, ax in plots.items()}
+    graph_images = {}
+    for kind in _get_graph_kinds(variable):
+        _, _, graph = _plot_graph((variable.name, kind, data, hue, color))
+        graph_images[kind] = graph
     return variable.name, graph_images
 
 
@@ -436,6 +637,24 @@ def _plot_regression(data_and_color: Tuple) -> Tuple:
     return (var1, var2), ax
 
 
+def _render_regression(data_and_color: Tuple) -> Tuple:
+    """Helper function to plot regression-plots concurrently, and save them
+    as PNG images within the worker process.
+
+    Returning images rather than matplotlib objects avoids pickling whole
+    figures back to the parent process, and encoding them there serially.
+
+    Args:
+        data_and_color (Tuple): Dataframe, and desired marker-color.
+
+    Returns:
+        Tuple: Names for the variable pair, and the regression plot in PNG
+        format.
+    """
+    var_pair, ax = _plot_regression(data_and_color)
+    return var_pair, _savefig(ax.figure)
+
+
 def _plot_dataset(variables: Dataset, color: str = None) -> Optional[Dict]:
     """Concurrently plot regression-plots in a multiprocessing Pool.
 
@@ -456,15 +675,14 @@ def _plot_dataset(variables: Dataset, color: str = None) -> Optional[Dict]:
         pairs_to_include = [
             pair for pair, _ in variables._correlation_values[:20]
         ]
-        with Pool() as p:
-            paired_data = [
-                (variables.data.loc[:, pair], color)
-                for pair in pairs_to_include
-            ]
+        paired_data = [
+            (variables.data.loc[:, pair], color) for pair in pairs_to_include
+        ]
+        with Pool(min(cpu_count(), len(paired_data))) as p:
             bivariate_regression_plots = dict(
                 tqdm(
-                    # Plot in parallel processes
-                    p.imap(_plot_regression, paired_data),
+                    # Plot and save graphs in parallel processes
+                    p.imap(_render_regression, paired_data),
                     # Progress-bar options
                     total=len(pairs_to_include),
                     bar_format=(
@@ -477,8 +695,37 @@ def _plot_dataset(variables: Dataset, color: str = None) -> Optional[Dict]:
             )
         return {
             "correlation_plot": _savefig(plot_correlation(variables).figure),
-            "regression_plots": {
-                var_pair: _savefig(plot.figure)
-                for var_pair, plot in bivariate_regression_plots.items()
-            },
+            "regression_plots": bivariate_regression_plots,
         }
+
+
+def _get_cached_graph(key: Tuple) -> Optional[BytesIO]:
+    """Look up a previously plotted univariate graph.
+
+    Args:
+        key (Tuple): The graph's cache key.
+
+    Returns:
+        Optional[io.BytesIO]: The graph in PNG format, if present.
+    """
+    graph = _GRAPH_CACHE.get(key)
+    if graph is None:
+        return None
+    else:
+        _GRAPH_CACHE.move_to_end(key)
+        # Return a new file-like object, so that reading it doesn't affect
+        # other reports.
+        return BytesIO(graph)
+
+
+def _cache_graph(key: Tuple, graph: BytesIO) -> None:
+    """Store a univariate graph, discarding the least recently used entry if
+    the cache is full.
+
+    Args:
+        key (Tuple): The graph's cache key.
+        graph (io.BytesIO): The graph in PNG format.
+    """
+    _GRAPH_CACHE[key] = graph.getvalue()
+    if len(_GRAPH_CACHE) > _MAX_CACHED_GRAPHS:
+        _GRAPH_CACHE.popitem(last=False)
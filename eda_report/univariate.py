@@ -1,8 +1,14 @@
+from collections import OrderedDict
 from collections.abc import Iterable
+from copy import copy
+from functools import lru_cache
+from hashlib import blake2b
 from textwrap import shorten
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple
 
-from pandas import DataFrame, Series
+import numpy as np
+from pandas import CategoricalDtype, DataFrame, Index, Series, factorize
+from pandas.util import hash_pandas_object
 from pandas.api.types import (
     is_bool_dtype,
     is_datetime64_any_dtype,
@@ -12,6 +18,81 @@ from scipy import stats
 
 from eda_report._validate import _validate_univariate_input
 
+# Recently analyzed variables, keyed by a hash of their name and contents
+_VARIABLE_CACHE = OrderedDict()
+_MAX_CACHED_VARIABLES = 128
+
+
+def _classify_dtype(dtype: Any) -> str:
+    """Classify a data type as "bool", "numeric", "datetime" or "other".
+
+    Args:
+        dtype (Any): A numpy or pandas data type.
+
+    Returns:
+        str: The kind of data type.
+    """
+    if is_numeric_dtype(dtype):
+        return "bool" if is_bool_dtype(dtype) else "numeric"
+    elif is_datetime64_any_dtype(dtype):
+        return "datetime"
+    else:
+        return "other"
+
+
+# Datasets typically have many columns, but only a few distinct data types
+_classify_cached = lru_cache(maxsize=64)(_classify_dtype)
+
+
+def _get_dtype_kind(dtype: Any) -> str:
+    """Get the kind of a data type, reusing earlier results where possible.
+
+    Categorical data types aren't cached, since each one holds its
+    categories.
+
+    Args:
+        dtype (Any): A numpy or pandas data type.
+
+    Returns:
+        str: The kind of data type.
+    """
+    if isinstance(dtype, CategoricalDtype):
+        return _classify_dtype(dtype)
+    else:
+        return _classify_cached(dtype)
+
+
+def _compute_moments(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """Compute the mean, standard deviation, skewness and (excess) kurtosis of
+    numeric values.
+
+    The deviations from the mean are computed once, and shared by all the
+    higher moments. The standard deviation, skewness and kurtosis are
+    bias-corrected, matching pandas' ``std``, ``skew`` and ``kurt``.
+
+    Args:
+        values (numpy.ndarray): Non-null numeric values (at least 4).
+
+    Returns:
+        Tuple[float, float, float, float]: The mean, standard deviation,
+        skewness and kurtosis.
+    """
+    num = len(values)
+    mean = values.mean()
+    deviations = values - mean
+    squared = deviations * deviations
+    m2 = squared.mean()
+    m3 = (squared * deviations).mean()
+    m4 = (squared * squared).mean()
+    std = np.sqrt(m2 * num / (num - 1))
+    skewness = m3 / m2**1.5 * np.sqrt(num * (num - 1)) / (num - 2)
+    kurtosis = (
+        ((num + 1) * (m4 / m2**2 - 3) + 6)
+        * (num - 1)
+        / ((num - 2) * (num - 3))
+    )
+    return mean, std, skewness, kurtosis
+
 
 class Variable:
 
@@ -34,6 +115,11 @@ class Variable:
 
     def __init__(self, data: Iterable, *, name: str = None) -> None:
         data = _validate_univariate_input(data, name=name)
+        # Drop missing values and get the unique values just once, then share
+        # the results. Factorizing builds a single hash table, whose codes
+        # are later reused to count values.
+        non_null = data.dropna()
+        codes, uniques = factorize(non_null, sort=False)
 
         #: str: The variable's *name*. If no name is specified, the name will
         #: be set the value of the ``name`` attribute of the input data, or 
@@ -42,24 +128,34 @@ class Variable:
 
         #: str: The type of variable — one of *"boolean"*, *"categorical"*,
         #: *"datetime"*, *"numeric"* or *"numeric (<=10 levels)"*.
-        self.var_type = self._get_variable_type(data)
+        self.var_type = self._get_variable_type(non_null, uniques)
 
         #: int: The *number of unique values* present in the variable.
-        self.num_unique = data.nunique()
+        self.num_unique = len(uniques)
 
         #: list: The *unique values* present in the variable.
-        self.unique_values = sorted(data.dropna().unique())
+        self.unique_values = sorted(uniques)
 
         #: str: The number of *missing values* in the form
         #: ``number (% of total count)`` e.g "4 (16.67%)".
-        self.missing = self._get_missing_values_info(data)
+        self.missing = self._get_missing_values_info(
+            num_missing=len(data) - len(non_null), num_total=len(data)
+        )
+
+        # Count values once, for both the summary statistics and the most
+        # common categories.
+        value_counts = self._get_value_counts(codes, uniques, name=self.name)
 
         #: dict: Descriptive statistics
-        self.summary_stats = self._get_summary_statistics(data)
+        self.summary_stats = self._get_summary_statistics(
+            non_null, value_counts
+        )
 
-        self._num_non_null = len(data.dropna())
-        self._normality_test_results = self._test_for_normality(data)
-        self._most_common_categories = self._get_most_common_categories(data)
+        self._num_non_null = len(non_null)
+        self._normality_test_results = self._test_for_normality(non_null)
+        self._most_common_categories = self._get_most_common_categories(
+            value_counts
+        )
 
     def __repr__(self) -> str:
         """Define the string representation of a `Variable`.
@@ -135,91 +231,143 @@ class Variable:
                 ]
             )
 
-    def _get_variable_type(self, data: Series) -> str:
+    def _get_variable_type(self, data: Series, uniques: Sequence) -> str:
         """Determine the variable type.
 
         Args:
-            data (pandas.Series): The data to analyze.
+            data (pandas.Series): The non-null data to analyze.
+            uniques (Sequence): The unique values in the data.
 
         Returns:
             str: The variable type: `boolean`, `categorical`, `datetime`,
             `numeric` or `numeric (<10 levels)`.
         """
-        if is_numeric_dtype(data):
-            if is_bool_dtype(data) or set(data.dropna()) == {0, 1}:
+        dtype_kind = _get_dtype_kind(data.dtype)
+        # Only two-valued data can be boolean. Compare the unique values
+        # rather than building a set from every observation.
+        unique_values = set(uniques) if len(uniques) == 2 else set()
+        if dtype_kind in {"bool", "numeric"}:
+            if dtype_kind == "bool" or unique_values == {0, 1}:
                 # Consider data consisting of ones and zeros as boolean
                 return "boolean"
-            elif data.nunique() <= 10:
+            elif len(uniques) <= 10:
                 # Consider numeric data with cardinality <= 10 as categorical
                 return "numeric (<=10 levels)"
             else:
                 return "numeric"
         # Accomodate common values for boolean variables
-        elif set(data.dropna()) in [
+        elif unique_values in [
             {False, True},
             {"False", "True"},
             {"No", "Yes"},
             {"N", "Y"},
         ]:
             return "boolean"
-        elif is_datetime64_any_dtype(data):
+        elif dtype_kind == "datetime":
             return "datetime"
         else:
             return "categorical"
 
-    def _get_missing_values_info(self, data: Series) -> Optional[str]:
+    def _get_missing_values_info(
+        self, num_missing: int, num_total: int
+    ) -> Optional[str]:
         """Get the number of missing values.
 
         Args:
-            data (pandas.Series): The data to analyze.
+            num_missing (int): The number of missing values.
+            num_total (int): The total number of values.
 
         Returns:
             Optional[str]: Details about the number of missing values.
         """
-        missing_values = data.isna().sum()
-        if missing_values == 0:
+        if num_missing == 0:
             return None
         else:
-            return f"{missing_values:,} ({missing_values / len(data):.2%})"
+            return f"{num_missing:,} ({num_missing / num_total:.2%})"
 
-    def _get_summary_statistics(self, data: Series) -> Dict:
+    def _get_value_counts(
+        self, codes: np.ndarray, uniques: Sequence, *, name: str = None
+    ) -> Optional[Series]:
+        """Count the occurrences of each value in categorical-like data.
+
+        Args:
+            codes (numpy.ndarray): Factorized codes of the non-null data.
+            uniques (Sequence): The unique values, in order of appearance.
+            name (str, optional): The variable's name. Defaults to None.
+
+        Returns:
+            Optional[pandas.Series]: Unsorted value counts, or ``None`` for
+            numeric and datetime variables.
+        """
+        if self.var_type in {"numeric", "datetime"}:
+            return None
+        else:
+            return Series(
+                np.bincount(codes, minlength=len(uniques)),
+                index=Index(uniques, name=name),
+                name="count",
+            )
+
+    def _get_summary_statistics(
+        self, data: Series, value_counts: Optional[Series] = None
+    ) -> Dict:
         """Compute summary statistics for the variable based on data type.
 
         Args:
-            data (pandas.Series): The data to analyze.
+            data (pandas.Series): The non-null data to analyze.
+            value_counts (pandas.Series, optional): Value counts for
+                categorical-like data. Defaults to None.
 
         Returns:
             Dict: Summary statistics.
         """
         if self.var_type == "numeric":
-            stats = data.describe()
+            values = data.to_numpy(dtype=float)
+            mean, std, skewness, kurtosis = _compute_moments(values)
+            # Get the extremes and quartiles from a single partitioning pass
+            minimum, lower, median, upper, maximum = np.quantile(
+                values, [0, 0.25, 0.5, 0.75, 1]
+            )
             return {
-                "Average": stats["mean"],
-                "Standard Deviation": stats["std"],
-                "Minimum": stats["min"],
-                "Lower Quartile": stats["25%"],
-                "Median": stats["50%"],
-                "Upper Quartile": stats["75%"],
-                "Maximum": stats["max"],
-                "Skewness": data.skew(),
-                "Kurtosis": data.kurt(),
+                "Average": mean,
+                "Standard Deviation": std,
+                "Minimum": minimum,
+                "Lower Quartile": lower,
+                "Median": median,
+                "Upper Quartile": upper,
+                "Maximum": maximum,
+                "Skewness": skewness,
+                "Kurtosis": kurtosis,
             }
         elif self.var_type == "datetime":
-            stats = data.describe()
+            summary = data.describe()
             return {
-                "Average": stats["mean"],
-                "Minimum": stats["min"],
-                "Lower Quartile": stats["25%"],
-                "Median": stats["50%"],
-                "Upper Quartile": stats["75%"],
-                "Maximum": stats["max"],
+                "Average": summary["mean"],
+                "Minimum": summary["min"],
+                "Lower Quartile": summary["25%"],
+                "Median": summary["50%"],
+                "Upper Quartile": summary["75%"],
+                "Maximum": summary["max"],
             }
         else:
-            data = data.copy().astype("category")
-            stats = data.describe()
+            if value_counts is None:
+                value_counts = data.value_counts(sort=False)
+            if value_counts.empty:
+                # All the values are missing
+                return {
+                    "Mode (Most frequent)": np.nan,
+                    "Maximum frequency": np.nan,
+                }
+            try:
+                # Break ties in favour of the smallest value, as with sorted
+                # categories.
+                value_counts = value_counts.sort_index(kind="stable")
+            except TypeError:
+                # Values that can't be compared keep their order of appearance
+                pass
             return {
-                "Mode (Most frequent)": stats["top"],
-                "Maximum frequency": stats["freq"],
+                "Mode (Most frequent)": value_counts.idxmax(),
+                "Maximum frequency": value_counts.max(),
             }
 
     def _test_for_normality(
@@ -228,30 +376,29 @@ class Variable:
         """Perform the "D'Agostino's K-squared", "Kolmogorov-Smirnov" and
         "Shapiro-Wilk" tests for normality.
 
+        The Shapiro-Wilk test is skipped for samples larger than 5000.
+
         Args:
-            data (pandas.Series): The data to analyze.
+            data (pandas.Series): The non-null data to analyze.
             alpha (float, optional): The level of significance. Defaults to
                 0.05.
 
         Returns:
             pandas.DataFrame: Table of results.
         """
-        data = data.dropna()
         if self.var_type == "numeric":
-            # The scipy implementation of the Shapiro-Wilk test reports:
-            # "For N > 5000 the W test statistic is accurate but the p-value
-            # may not be."
-            shapiro_sample = data.sample(5000) if len(data) > 5000 else data
-            tests = [
-                "D'Agostino's K-squared test",
-                "Kolmogorov-Smirnov test",
-                "Shapiro-Wilk test",
-            ]
+            values = data.to_numpy()
+            tests = ["D'Agostino's K-squared test", "Kolmogorov-Smirnov test"]
             p_values = [
-                stats.normaltest(data).pvalue,
-                stats.kstest(data, "norm", N=200).pvalue,
-                stats.shapiro(shapiro_sample).pvalue,
+                stats.normaltest(values).pvalue,
+                stats.kstest(values, "norm", N=200).pvalue,
             ]
+            # The scipy implementation of the Shapiro-Wilk test reports:
+            # "For N > 5000 the W test statistic is accurate but the p-value
+            # may not be." Rather than test an arbitrary sample, skip it.
+            if len(values) <= 5000:
+                tests.append("Shapiro-Wilk test")
+                p_values.append(stats.shapiro(values).pvalue)
             results = DataFrame(index=tests)
             results["p-value"] = [f"{x:.7f}" for x in p_values]
             results[f"Conclusion at α = {alpha}"] = [
@@ -264,23 +411,26 @@ class Variable:
         else:
             return None
 
-    def _get_most_common_categories(self, data: Series) -> Dict:
+    def _get_most_common_categories(
+        self, value_counts: Optional[Series]
+    ) -> Optional[Dict]:
         """Get the top 10 frequently occuring categories.
 
         Args:
-            data (pandas.Series): The data to analyze.
+            value_counts (Optional[pandas.Series]): Value counts for
+                categorical-like data.
 
         Returns:
-            Dict: Top 10 categories and their frequency info.
+            Optional[Dict]: Top 10 categories and their frequency info.
         """
-        data = data.dropna()
-        if self.var_type in {"numeric", "datetime"}:
+        if value_counts is None:
             return None
         else:
-            top_10 = data.value_counts().nlargest(10)
+            # A partial selection, rather than sorting all the counts
+            top_10 = value_counts.nlargest(10)
+            total = value_counts.sum()
             return {
-                key: f"{val} ({val/len(data):.2%})"
-                for key, val in top_10.items()
+                key: f"{val} ({val/total:.2%})" for key, val in top_10.items()
             }
 
     def rename(self, name: str) -> None:
@@ -304,3 +454,48 @@ def _analyze_univariate(name_and_data: Tuple) -> Variable:
     name, data = name_and_data
     var = Variable(data, name=name)
     return name, var
+
+
+def _get_cache_key(data: Series) -> Tuple:
+    """Get a key identifying a variable by its name, data type and contents.
+
+    Args:
+        data (pandas.Series): The variable's data.
+
+    Returns:
+        Tuple: The cache key.
+    """
+    row_hashes = hash_pandas_object(data, index=False).to_numpy()
+    digest = blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+    return (data.name, str(data.dtype), len(data), digest)
+
+
+def _get_cached_variable(key: Tuple) -> Optional[Variable]:
+    """Look up a previously analyzed variable.
+
+    Args:
+        key (Tuple): The variable's cache key.
+
+    Returns:
+        Optional[Variable]: A copy of the cached `Variable`, if present.
+    """
+    variable = _VARIABLE_CACHE.get(key)
+    if variable is None:
+        return None
+    else:
+        _VARIABLE_CACHE.move_to_end(key)
+        # Return a copy, so that renaming it doesn't alter the cached instance
+        return copy(variable)
+
+
+def _cache_variable(key: Tuple, variable: Variable) -> None:
+    """Store analysis results, discarding the least recently used entry if
+    the cache is full.
+
+    Args:
+        key (Tuple): The variable's cache key.
+        variable (Variable): `Variable` instance.
+    """
+    _VARIABLE_CACHE[key] = copy(variable)
+    if len(_VARIABLE_CACHE) > _MAX_CACHED_VARIABLES:
+        _VARIABLE_CACHE.popitem(last=False)
@@ -1,9 +1,11 @@
 from io import BytesIO
 
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, crosstab
 
 from eda_report._analysis import _AnalysisResult, _get_contingency_tables
 from eda_report.bivariate import Dataset
+from eda_report.plotting import _GRAPH_CACHE
+from eda_report.univariate import _VARIABLE_CACHE
 
 data = DataFrame(
     {"A": range(50), "B": [1, 2, 3, 4, 5] * 10, "C": list("ab") * 25}
@@ -45,6 +47,18 @@ class TestGetContingencyTables:
             "Total": {"b": 8, "c": 4, "Total": 12},
         }
 
+    def test_with_missing_values(self):
+        data = DataFrame(
+            {"A": ["a", None, "b", "a"] * 3, "B": [1, 2, None, 2] * 3}
+        )
+        tables = _get_contingency_tables(
+            categorical_df=data, groupby_data=data["B"]
+        )
+        # Only rows with values for both variables are counted
+        assert tables["A"].equals(
+            crosstab(data["A"], data["B"], margins=True, margins_name="Total")
+        )
+
     def test_cardinality_limit(self):
         high_cardinality_data = DataFrame(
             {
@@ -116,3 +130,80 @@ class TestAnalysisResult:
             "regression_plots"
         ].values():
             assert isinstance(graph, BytesIO)
+
+
+def test_lazy_graphs():
+    results = _AnalysisResult(data)
+    # Graphs should only be plotted when first accessed
+    assert "univariate_graphs" not in vars(results)
+    assert "bivariate_graphs" not in vars(results)
+    graphs = results.univariate_graphs
+    assert set(graphs) == {"A", "B", "C"}
+    assert results.univariate_graphs is graphs
+    bivariate_graphs = results.bivariate_graphs
+    assert "correlation_plot" in bivariate_graphs
+    assert results.bivariate_graphs is bivariate_graphs
+
+
+def test_caching_is_opt_in(monkeypatch):
+    def fail_to_hash(data):
+        raise AssertionError("Columns should not be hashed.")
+
+    # Without caching, columns aren't hashed, and nothing is stored
+    monkeypatch.setattr("eda_report._analysis._get_cache_key", fail_to_hash)
+    num_cached = len(_VARIABLE_CACHE), len(_GRAPH_CACHE)
+    results = _AnalysisResult(data.rename(columns={"A": "uncached"}))
+    assert set(results.univariate_graphs["uncached"]) == {
+        "box_plot",
+        "kde_plot",
+        "prob_plot",
+    }
+    assert (len(_VARIABLE_CACHE), len(_GRAPH_CACHE)) == num_cached
+
+
+class _RecordingPool:
+    """Stands in for ``multiprocessing.Pool``, running tasks in-process and
+    recording them."""
+
+    tasks = []
+
+    def __init__(self, processes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def imap(self, func, iterable, chunksize=1):
+        for task in iterable:
+            self.tasks.append(task)
+            yield func(task)
+
+
+def test_cached_univariate_graphs(monkeypatch):
+    graphs = _AnalysisResult(data, cache=True).univariate_graphs
+    # Graphs for unchanged data should be reused in later analyses, without
+    # plotting anything.
+    monkeypatch.setattr("eda_report._analysis.Pool", _RecordingPool)
+    monkeypatch.setattr(_RecordingPool, "tasks", [])
+    cached_graphs = _AnalysisResult(data, cache=True).univariate_graphs
+    assert _RecordingPool.tasks == []
+    for name, variable_graphs in graphs.items():
+        for kind, graph in variable_graphs.items():
+            assert cached_graphs[name][kind].getvalue() == graph.getvalue()
+
+
+def test_partially_cached_univariate_graphs(monkeypatch):
+    results = _AnalysisResult(data, cache=True)
+    results.univariate_graphs
+    # Evict one of a variable's graphs from the cache
+    del _GRAPH_CACHE[(results._cache_keys["A"], "box_plot", "cyan", None)]
+
+    monkeypatch.setattr("eda_report._analysis.Pool", _RecordingPool)
+    monkeypatch.setattr(_RecordingPool, "tasks", [])
+    graphs = _AnalysisResult(data, cache=True).univariate_graphs
+    # Only the evicted graph is plotted, and the graphs keep their order
+    assert [task[:2] for task in _RecordingPool.tasks] == [("A", "box_plot")]
+    assert list(graphs["A"]) == ["box_plot", "kde_plot", "prob_plot"]
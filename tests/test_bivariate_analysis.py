@@ -18,15 +18,22 @@ sample_data = DataFrame(
 
 
 def test_correlation_computation():
-    data = sample_data.copy()
     assert _compute_correlation(None) is None
 
     # Check that < 2 numeric cols returns None
-    assert _compute_correlation(data[["A", "B"]]) is None
+    assert _compute_correlation(sample_data[["A", "B"]]) is None
 
     # Check that only numeric columns are processed
-    assert _compute_correlation(data) == pytest.approx(
-        [(("A", "D"), 0.21019754169815516)]
+    # (pytest.approx doesn't compare values nested in the pairs' tuples)
+    assert dict(_compute_correlation(sample_data)) == pytest.approx(
+        {("A", "D"): 0.21019754169815516}
+    )
+
+    # Check that pairs are correlated over the rows where both have values
+    with_missing = sample_data[["A", "D"]].astype(float)
+    with_missing.iloc[::3, 0] = None
+    assert dict(_compute_correlation(with_missing)) == pytest.approx(
+        {("A", "D"): with_missing["A"].corr(with_missing["D"])}
     )
 
 
@@ -41,14 +48,26 @@ def test_correlation_description():
         _describe_correlation(0.1) == "very weak positive correlation (0.10)"
     )
     assert _describe_correlation(0.025) == "virtually no correlation (0.03)"
+    # The strength is judged from the unrounded coefficient
+    assert _describe_correlation(0.795) == "strong positive correlation (0.80)"
 
 
 class TestDataset:
-    dataset = Dataset(sample_data.copy())
+    dataset = Dataset(sample_data)
 
     def test_stored_data(self):
         assert isinstance(self.dataset.data, DataFrame)
 
+    def test_lazy_summary_statistics(self):
+        dataset = Dataset(sample_data)
+        # Summary statistics should only be computed when first accessed
+        assert "_summary_statistics" not in vars(dataset)
+        numeric_stats = dataset._numeric_stats
+        # Both kinds of statistics are computed together, just once
+        assert "_summary_statistics" in vars(dataset)
+        assert dataset._summary_statistics[0] is numeric_stats
+        assert dataset._numeric_stats is numeric_stats
+
     def test_categorical_summary_statistics(self):
         assert self.dataset._categorical_stats.to_dict() == {
             "count": {"B": 50, "C": 50, "D": 50},
@@ -77,8 +96,8 @@ class TestDataset:
         )
 
     def test_correlation(self):
-        assert self.dataset._correlation_values == pytest.approx(
-            [(("A", "D"), 0.21019754169815516)]
+        assert dict(self.dataset._correlation_values) == pytest.approx(
+            {("A", "D"): 0.21019754169815516}
         )
         assert self.dataset._correlation_descriptions == {
             ("A", "D"): "weak positive correlation (0.21)"
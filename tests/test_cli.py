@@ -6,13 +6,10 @@ from eda_report.gui import EDAGUI
 
 
 class TestCLIArgumentParsing:
-    def test_with_all_args(self, temp_data_dir, monkeypatch):
-        # Simulate supplying all args
-        monkeypatch.setattr(
-            sys,
-            "argv",
+    def test_with_all_args(self, temp_data_dir):
+        # Supply all args directly
+        run_from_cli(
             [
-                "eda-report",
                 "-i",
                 f"{temp_data_dir / 'data.csv'}",
                 "-o",
@@ -23,18 +20,14 @@ class TestCLIArgumentParsing:
                 "teal",
                 "-g",
                 "A",
-            ],
+            ]
         )
-        run_from_cli()
         expected_output = temp_data_dir / "cli-test-1.docx"
         assert expected_output.is_file()
 
-    def test_with_only_input_file(self, temp_data_dir, monkeypatch):
+    def test_with_only_input_file(self, temp_excel_file):
         # Supply the input file it has no default.
-        monkeypatch.setattr(
-            sys, "argv", ["eda-report", "-i", f"{temp_data_dir / 'data.xlsx'}"]
-        )
-        run_from_cli()
+        run_from_cli(["-i", f"{temp_excel_file}"])
         expected_output = Path("eda-report.docx")
         assert expected_output.is_file()
 
@@ -1,7 +1,9 @@
+import numpy as np
 import pytest
-from pandas import DataFrame, Series
+from pandas import DataFrame, RangeIndex, Series, date_range
 
 from eda_report._validate import (
+    _check_cardinality,
     _clean_column_labels,
     _validate_dataset,
     _validate_groupby_variable,
@@ -19,6 +21,25 @@ class TestDatasetValidation:
         # Check if a dataframe is returned as a dataframe
         assert isinstance(_validate_dataset(DataFrame(range(10))), DataFrame)
 
+    def test_dataframe_not_modified(self):
+        # Check that dataframes are used without copying their values, and
+        # without relabelling their columns
+        data = DataFrame({1: [1.5, 2.5], 2: [3.5, 4.5]})
+        validated = _validate_dataset(data)
+        assert list(validated.columns) == ["var_1", "var_2"]
+        assert list(data.columns) == [1, 2]
+        assert np.shares_memory(validated["var_1"].to_numpy(), data[1])
+
+    def test_object_columns_inferred(self):
+        # Check that better dtypes are inferred for object columns
+        data = DataFrame({"A": [1, 2, 3]}, dtype=object)
+        assert _validate_dataset(data)["A"].dtype == "int64"
+
+    def test_object_inference_uses_all_rows(self):
+        # Check that dtypes aren't inferred from just the first rows
+        data = DataFrame({"A": [*range(200_000), "last"]}, dtype=object)
+        assert _validate_dataset(data)["A"].dtype == object
+
     def test_series_input(self):
         # Check if a series returns a dataframe
         assert isinstance(_validate_dataset(Series(range(10))), DataFrame)
@@ -60,6 +81,14 @@ class TestUnivariateInputValidation:
             _validate_univariate_input(Series(range(10))), Series
         )
 
+    def test_array_input(self):
+        # Check that numpy arrays are wrapped without copying their values
+        array = np.arange(10.0)
+        series = _validate_univariate_input(array, name="x")
+        assert isinstance(series, Series)
+        assert series.name == "x"
+        assert np.shares_memory(series.to_numpy(), array)
+
     def test_iterable_input(self):
         # Check if a sequence-like returns a series
         assert isinstance(_validate_univariate_input(range(10)), Series)
@@ -100,6 +129,14 @@ class TestTargetValidation:
             data=self.data, groupby_variable=3
         ).equals(self.data.get("D"))
 
+    def test_column_index_types(self):
+        # Check that numpy integers and digit strings (e.g. from the command
+        # line) are accepted as column indices.
+        for idx in [np.int64(3), "3"]:
+            assert _validate_groupby_variable(
+                data=self.data, groupby_variable=idx
+            ).equals(self.data.get("D"))
+
     def test_invalid_column_index(self):
         # Check that an error is raised for a column index that is out of
         # bounds.
@@ -121,6 +158,15 @@ class TestTargetValidation:
             _validate_groupby_variable(data=self.data, groupby_variable="X")
         assert "'X' is not in ['A', 'B', 'C', 'D', 'E']" in str(error.value)
 
+    def test_invalid_column_label_in_wide_data(self):
+        # Check that error messages list a limited number of columns
+        wide_data = DataFrame(
+            [range(100)], columns=[f"c{i}" for i in range(100)]
+        )
+        with pytest.raises(GroupbyVariableError) as error:
+            _validate_groupby_variable(data=wide_data, groupby_variable="X")
+        assert str(error.value).endswith("'c19'] (and 80 more)")
+
     def test_null_input(self):
         # Check that `groupby_variable=None` returns `None`
         assert (
@@ -157,6 +203,21 @@ class TestTargetValidation:
         assert expected_message in str(error.value)
         assert expected_message in caplog.text
 
+    def test_categorical_groupby_variable(self):
+        # Check that categorical data is judged by its observed values
+        few_categories = Series(list("ab") * 10, dtype="category")
+        assert _check_cardinality(few_categories) is None
+        many_categories = few_categories.cat.add_categories(range(20))
+        assert _check_cardinality(many_categories) is None
+        with pytest.raises(GroupbyVariableError):
+            _check_cardinality(Series(range(20), dtype="category"))
+
+    def test_short_groupby_variable(self):
+        # Check that data with no more values than the threshold is accepted
+        assert _check_cardinality(Series(range(5)), threshold=5) is None
+        with pytest.raises(GroupbyVariableError):
+            _check_cardinality(Series(range(6)), threshold=5)
+
 
 class TestColumnLabelCleaning:
     def test_cleaning_rangeindex(self):
@@ -167,6 +228,14 @@ class TestColumnLabelCleaning:
             "var_2",
         ]
 
+    def test_cleaning_other_rangeindexes(self):
+        # Labels should be numbered from the start of the range
+        offset_range = DataFrame([[1, 2]], columns=RangeIndex(1, 3))
+        assert list(_clean_column_labels(offset_range)) == ["var_2", "var_3"]
+        # Wide data should get labels beyond the prebuilt ones
+        wide_data = DataFrame([range(2000)])
+        assert _clean_column_labels(wide_data).columns[-1] == "var_2000"
+
     def test_cleaning_numeric_colnames(self):
         with_numeric_colnames = DataFrame([[1, 2], [3, 4]], columns=[1, 5])
         # Column names should be prefixed with "var_"
@@ -179,3 +248,19 @@ class TestColumnLabelCleaning:
         with_mixed_colnames = DataFrame([[1, 2], [3, 4]], columns=[1, "B"])
         # Numeric column names should be converted to strings
         assert list(_clean_column_labels(with_mixed_colnames)) == ["1", "B"]
+
+    def test_cleaning_datetime_colnames(self):
+        with_datetime_colnames = DataFrame(
+            [[1, 2]], columns=date_range("2022-01-01", periods=2)
+        )
+        # Labels should match the timestamps' string representation
+        assert list(_clean_column_labels(with_datetime_colnames)) == [
+            "2022-01-01 00:00:00",
+            "2022-01-02 00:00:00",
+        ]
+
+    def test_cleaning_clean_colnames(self):
+        clean_data = _clean_column_labels(DataFrame([[1, 2]]))
+        labels = clean_data.columns
+        # Labels that are already strings should be left as they are
+        assert _clean_column_labels(clean_data).columns is labels
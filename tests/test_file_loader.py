@@ -12,9 +12,9 @@ class TestFileLoader:
         # Check that a valid csv file is read as a DataFrame
         assert df_from_file(temp_data_dir / "data.csv").equals(self.data)
 
-    def test_excel_file_load(self, temp_data_dir):
+    def test_excel_file_load(self, temp_excel_file):
         # Check that a valid excel file is read as a DataFrame
-        assert df_from_file(temp_data_dir / "data.xlsx").equals(self.data)
+        assert df_from_file(temp_excel_file).equals(self.data)
 
     def test_invalid_file(self):
         # Check that an invalid file format/extension raises an InputError
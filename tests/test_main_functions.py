@@ -20,9 +20,43 @@ def test_get_word_report_function():
     assert isinstance(report, ReportDocument)
 
 
+def test_get_word_report_cache(tmp_path):
+    output_filename = tmp_path / "report.docx"
+    report = get_word_report(
+        sample_data, output_filename=output_filename, cache=True
+    )
+    # Re-running the report reuses (copies of) the earlier analysis results
+    rerun = get_word_report(
+        sample_data, output_filename=output_filename, cache=True
+    )
+    for name, variable in report.variables.items():
+        assert rerun.variables[name].summary_stats is variable.summary_stats
+
+
+def test_get_word_report_cached_graphs(tmp_path, monkeypatch):
+    output_filename = tmp_path / "report.docx"
+    get_word_report(sample_data, output_filename=output_filename, cache=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Cached variables were re-analyzed or re-plotted")
+
+    # Re-running the report shouldn't analyze or plot anything again
+    monkeypatch.setattr("eda_report._analysis.Pool", fail)
+    report = get_word_report(
+        sample_data, output_filename=output_filename, cache=True
+    )
+    assert set(report.univariate_graphs) == set(sample_data.columns)
+
+
 def test_summarize_function():
     summary_1D = summarize(range(25))
     assert isinstance(summary_1D, Variable)
 
     summary_2D = summarize(sample_data)
     assert isinstance(summary_2D, Dataset)
+
+    # Columns with only missing values are dropped, leaving nothing to
+    # summarize.
+    summary_missing = summarize([None, None, None])
+    assert isinstance(summary_missing, Dataset)
+    assert summary_missing.data.shape == (3, 0)
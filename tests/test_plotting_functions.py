@@ -1,16 +1,27 @@
 from io import BytesIO
 
+import numpy as np
 import pytest
+from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 from matplotlib.colors import to_rgb
 from matplotlib.figure import Figure
 from pandas import DataFrame, Series
+from PIL import Image
+from scipy.stats import gaussian_kde
 
 from eda_report.bivariate import Dataset
 from eda_report.plotting import (
+    _cache_graph,
     _get_or_validate_axes,
+    _fit_kde,
+    _get_cached_graph,
     _get_color_shades_of,
+    _get_kde_density,
+    _get_graph_kinds,
+    _get_pooled_axes,
     _plot_dataset,
+    _plot_graph,
     _plot_regression,
     _plot_variable,
     _savefig,
@@ -24,8 +35,15 @@ from eda_report.univariate import Variable
 
 
 def test_savefig_function():
-    saved = _savefig(figure=Figure())
+    figure = Figure(figsize=(5, 4), dpi=100)
+    saved = _savefig(figure=figure)
     assert isinstance(saved, BytesIO)
+    # Graphs should be valid PNG images, rendered at the `savefig.dpi` (120)
+    with Image.open(saved) as image:
+        assert image.format == "PNG"
+        assert image.size == (600, 480)
+    # The figure's own resolution should be left unchanged
+    assert figure.dpi == 100
 
 
 def test_get_color_shades_of():
@@ -52,6 +70,16 @@ class TestGetAxesFunction:
         assert "Invalid input for 'ax': <class 'int'>" in str(error.value)
 
 
+def test_get_pooled_axes():
+    ax = _get_pooled_axes("kde_plot")
+    ax.set_title("Some title")
+    reused_ax = _get_pooled_axes("kde_plot")
+    # Axes should be reused for the same kind of graph, after being cleared
+    assert reused_ax is ax
+    assert reused_ax.get_title() == ""
+    assert _get_pooled_axes("prob_plot") is not ax
+
+
 class TestBoxplot:
     data = Series(list(range(25)) + [None, None])
     hue = Series([1, 2, 3] * 9, name="hue-name")
@@ -190,6 +218,33 @@ class TestKdeplot:
         assert to_rgb(first_kde_color) == pytest.approx(to_rgb("C0"))
         assert to_rgb(first_kde2_color) == pytest.approx(to_rgb(_color))
 
+    def test_large_sample_kde(self):
+        # Large samples should be thinned, keeping the full-sample bandwidth
+        data = Series(range(50_000))
+        kernel = _fit_kde(data, max_size=1000)
+        assert kernel.n == 1000
+        assert kernel.covariance == pytest.approx(
+            gaussian_kde(data).covariance
+        )
+        assert _fit_kde(data[:500], max_size=1000).n == 500
+
+    def test_binned_kde(self):
+        # Binned estimates for large samples should match the exact estimate
+        data = Series(np.random.default_rng(0).normal(size=20_000))
+        eval_points = np.linspace(data.min(), data.max(), num=200)
+        exact = gaussian_kde(data)(eval_points)
+        binned = _get_kde_density(data, eval_points)
+        assert binned == pytest.approx(exact, abs=1e-3 * exact.max())
+
+    def test_binned_kde_is_not_shifted(self):
+        # The kernel should be centred, so that symmetric data gets a
+        # symmetric density.
+        half = np.random.default_rng(0).exponential(size=10_000)
+        data = Series(np.concatenate([half, -half]))
+        eval_points = np.linspace(-3, 3, num=61)
+        density = _get_kde_density(data, eval_points)
+        assert density == pytest.approx(density[::-1], rel=1e-6)
+
 
 class TestProbplot:
     data = Series(list(range(25)) + [None, None])
@@ -227,6 +282,13 @@ class TestProbplot:
         assert markers.get_color() == "yellow"
         assert reg_line.get_color() == "salmon"
 
+    def test_single_value(self):
+        # A line of best fit needs at least 2 points, so only the data is
+        # plotted.
+        for data in [[1.0], [None, None, 1.0]]:
+            (markers,) = prob_plot(data, label="single-value").lines
+            assert list(markers.get_ydata()) == [1.0]
+
 
 class TestBarplot:
     low_cardinality_data = Series(list("abcdeabcdabcaba"))
@@ -289,6 +351,61 @@ class TestPlotvariable:
             assert isinstance(graph, BytesIO)
 
 
+class TestPlotGraph:
+    def test_graph_kinds(self):
+        numeric_var = Variable(range(25))
+        categorical_var = Variable(list("abcdeabcdabcaba"))
+        assert _get_graph_kinds(numeric_var) == (
+            "box_plot",
+            "kde_plot",
+            "prob_plot",
+        )
+        assert _get_graph_kinds(categorical_var) == ("bar_plot",)
+
+    def test_single_graph(self):
+        name, kind, graph = _plot_graph(
+            name_kind_data_hue_and_color=(
+                "numbers",
+                "kde_plot",
+                range(25),
+                None,
+                "teal",
+            )
+        )
+        assert name == "numbers"
+        assert kind == "kde_plot"
+        assert isinstance(graph, BytesIO)
+
+    def test_no_figures_registered(self):
+        # Graphs should not be tracked by pyplot, whose figure registry would
+        # keep every rendered figure in memory.
+        open_figures = plt.get_fignums()
+        for kind in ["box_plot", "kde_plot", "prob_plot", "bar_plot"]:
+            _plot_graph(
+                name_kind_data_hue_and_color=("x", kind, range(25), None, "b")
+            )
+        data = DataFrame({"a": [1, 2, 3], "b": [3, 5, 4]})
+        correlation_plot = plot_correlation(data)
+        _savefig(correlation_plot.figure)
+        assert plt.get_fignums() == open_figures
+
+
+class TestGraphCache:
+    key = (("cached", "int64", 3, "digest"), "kde_plot", "teal", None)
+
+    def test_cache_lookup(self):
+        graph = BytesIO(b"png-bytes")
+        _cache_graph(self.key, graph)
+        cached = _get_cached_graph(self.key)
+        assert cached.getvalue() == b"png-bytes"
+        # Each lookup should get a separate file-like object
+        assert cached is not graph
+        assert _get_cached_graph(self.key) is not cached
+
+    def test_cache_miss(self):
+        assert _get_cached_graph(self.key[:-1] + ("hue",)) is None
+
+
 class TestPlotCorrelation:
     def test_with_insufficient_numeric_pairs(self):
         # Check None is returned if there are < 2 numeric pairs
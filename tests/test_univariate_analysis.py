@@ -1,7 +1,17 @@
+import numpy as np
 import pytest
-from pandas import DataFrame, Timestamp, date_range
+from pandas import DataFrame, Series, Timestamp, date_range
 
-from eda_report.univariate import Variable, _analyze_univariate
+from eda_report.univariate import (
+    Variable,
+    _analyze_univariate,
+    _cache_variable,
+    _classify_cached,
+    _compute_moments,
+    _get_cache_key,
+    _get_cached_variable,
+    _get_dtype_kind,
+)
 
 
 class TestDtypeDetection:
@@ -21,6 +31,25 @@ class TestDtypeDetection:
         numeric = Variable(range(20))
         assert numeric.var_type == "numeric"
 
+    def test_dtype_kind(self):
+        assert _get_dtype_kind(Series([True]).dtype) == "bool"
+        assert _get_dtype_kind(Series([1.5]).dtype) == "numeric"
+        assert _get_dtype_kind(date_range("2022-01-01", periods=1).dtype) == (
+            "datetime"
+        )
+        assert _get_dtype_kind(Series(["a"], dtype="string").dtype) == "other"
+
+    def test_categorical_dtype_kind(self):
+        # Categorical dtypes are judged as before, and aren't kept in the
+        # cache.
+        num_cached = _classify_cached.cache_info().currsize
+        bool_categories = Series([True, True], dtype="category")
+        assert _get_dtype_kind(bool_categories.dtype) == "other"
+        assert _classify_cached.cache_info().currsize == num_cached
+        # Only one boolean value is observed
+        bool_categories = bool_categories.cat.add_categories([False])
+        assert Variable(bool_categories).var_type == "categorical"
+
 
 class TestGeneralVariableProperties:
     variable = Variable(list(range(20)) + [None], name="some-variable")
@@ -73,6 +102,34 @@ class TestCategoricalVariables:
             "d": "1 (20.00%)",
         }
 
+    def test_unobserved_categories(self):
+        # Categories that never occur in the data shouldn't be counted
+        variable = Variable(
+            Series(["a", "b", "a"], dtype="category").cat.add_categories("z")
+        )
+        assert variable.num_unique == 2
+        assert variable._most_common_categories == {
+            "a": "2 (66.67%)",
+            "b": "1 (33.33%)",
+        }
+
+    def test_tied_modes(self):
+        # Ties should go to the smallest value, whatever the order of values
+        assert Variable([True, False] * 30).summary_stats == {
+            "Mode (Most frequent)": False,
+            "Maximum frequency": 30,
+        }
+        assert Variable(list("cab") * 2).summary_stats == {
+            "Mode (Most frequent)": "a",
+            "Maximum frequency": 2,
+        }
+
+    def test_all_missing_values(self):
+        for data in [[None, None, None], Series([np.nan] * 5)]:
+            summary_stats = Variable(data).summary_stats
+            assert np.isnan(summary_stats["Mode (Most frequent)"])
+            assert np.isnan(summary_stats["Maximum frequency"])
+
     def test_normality_results(self):
         assert self.categorical_variable._normality_test_results is None
         assert self.numeric_categories._normality_test_results is None
@@ -200,3 +257,45 @@ def test_analyse_variable():
 
     assert name == "wantufifty"
     assert isinstance(variable, Variable)
+
+
+def test_normality_tests_for_large_samples():
+    # The Shapiro-Wilk test should be skipped for samples larger than 5000
+    large_variable = Variable(range(5001))
+    assert set(large_variable._normality_test_results.index) == {
+        "D'Agostino's K-squared test",
+        "Kolmogorov-Smirnov test",
+    }
+
+
+class TestVariableCache:
+    data = Series(range(30), name="cached")
+
+    def test_cache_key(self):
+        assert _get_cache_key(self.data) == _get_cache_key(self.data.copy())
+        # Different names or contents should give different keys
+        assert _get_cache_key(self.data) != _get_cache_key(
+            self.data.rename("other")
+        )
+        assert _get_cache_key(self.data) != _get_cache_key(self.data + 1)
+
+    def test_cache_lookup(self):
+        key = _get_cache_key(self.data)
+        variable = Variable(self.data)
+        _cache_variable(key, variable)
+
+        cached = _get_cached_variable(key)
+        assert cached.summary_stats == variable.summary_stats
+        # Renaming a cached copy should leave the cache intact
+        cached.rename("renamed")
+        assert _get_cached_variable(key).name == "cached"
+
+    def test_cache_miss(self):
+        assert _get_cached_variable(_get_cache_key(self.data * 7)) is None
+
+
+def test_compute_moments():
+    data = Series([2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31], dtype=float)
+    assert _compute_moments(data.to_numpy()) == pytest.approx(
+        (data.mean(), data.std(), data.skew(), data.kurt())
+    )